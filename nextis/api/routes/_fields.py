@@ -0,0 +1,23 @@
+"""Sparse-fieldset support shared by the polling endpoints."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+def include_fields(model_cls: type[BaseModel], fields: str | None) -> set[str] | None:
+    """Translate a ``?fields=`` query value into a ``model_dump`` include set.
+
+    Args:
+        model_cls: Pydantic model being serialized.
+        fields: Comma-separated camelCase keys (aliases or field names), or
+            None/empty for all fields.
+
+    Returns:
+        Model field names to pass as ``model_dump(include=...)``, or None to
+        serialize every field. Unknown keys are ignored.
+    """
+    if not fields:
+        return None
+    wanted = set(fields.split(","))
+    return {name for name, info in model_cls.model_fields.items() if (info.alias or name) in wanted}
@@ -16,7 +16,7 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, File, HTTPException, Response, UploadFile
 from fastapi.responses import StreamingResponse
 
 from nextis.api.schemas import AssemblySummary, PlanAnalysisResponse, PlanSuggestionResponse
@@ -76,6 +76,13 @@ async def list_assemblies() -> list[AssemblySummary]:
     return summaries
 
 
+@router.head("/{assembly_id}")
+async def assembly_exists(assembly_id: str) -> Response:
+    """Existence probe: 200 if the assembly exists, 404 otherwise (no body, no parse)."""
+    _find_assembly_path(assembly_id)
+    return Response(status_code=200)
+
+
 @router.get("/{assembly_id}")
 async def get_assembly(assembly_id: str) -> dict[str, Any]:
     """Get the full assembly graph by ID."""
@@ -1,19 +1,23 @@
-"""Execution lifecycle routes and WebSocket endpoint.
+"""Execution lifecycle routes, WebSocket and Server-Sent Events endpoints.
 
 Manages a single Sequencer instance that walks the assembly graph.
-State changes are pushed to connected WebSocket clients in real time.
+State changes are pushed to connected WebSocket and SSE clients in real time.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 from nextis.analytics.store import AnalyticsStore
+from nextis.api.routes._fields import include_fields
 from nextis.api.schemas import ExecutionState
 from nextis.assembly.models import AssemblyGraph
 from nextis.control.primitives import PrimitiveLibrary
@@ -31,6 +35,10 @@ ANALYTICS_DIR = Path(__file__).resolve().parents[3] / "data" / "analytics"
 _sequencer: Sequencer | None = None
 _analytics_store: AnalyticsStore | None = None
 _ws_connections: set[WebSocket] = set()
+_sse_queues: set[asyncio.Queue[dict]] = set()
+
+# Seconds between SSE keep-alive comments when no state change occurs.
+SSE_KEEPALIVE_S = 5.0
 
 
 # ------------------------------------------------------------------
@@ -39,11 +47,19 @@ _ws_connections: set[WebSocket] = set()
 
 
 def _broadcast_state(state: ExecutionState) -> None:
-    """Push execution state to all connected WebSocket clients.
+    """Push execution state to all connected WebSocket and SSE clients.
 
     Called synchronously from the Sequencer callback. Schedules async
     sends on the running event loop.
     """
+    if _sse_queues:
+        snapshot = state.model_dump(by_alias=True)
+        for queue in _sse_queues:
+            if queue.full():
+                # Slow consumer — states are full snapshots, so drop the stalest.
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+
     if not _ws_connections:
         return
 
@@ -80,12 +96,28 @@ class StartRequest(BaseModel):
 # ------------------------------------------------------------------
 
 
+def _current_state(include: set[str] | None = None) -> dict:
+    """Snapshot of the current execution state as camelCase JSON.
+
+    Args:
+        include: Optional model field names to serialize; all fields if None.
+    """
+    state = ExecutionState() if _sequencer is None else _sequencer.get_execution_state()
+    return state.model_dump(by_alias=True, include=include)
+
+
 @router.get("/state")
-async def get_execution_state() -> dict:
-    """Return the current execution state."""
-    if _sequencer is None:
-        return ExecutionState().model_dump(by_alias=True)
-    return _sequencer.get_execution_state().model_dump(by_alias=True)
+async def get_execution_state(
+    fields: str | None = Query(
+        None, description="Comma-separated camelCase keys to return, e.g. phase,currentStepId"
+    ),
+) -> dict:
+    """Return the current execution state.
+
+    With ``fields``, only those keys are serialized, so pollers that only need
+    ``phase`` skip the ``stepStates`` payload that grows with every step.
+    """
+    return _current_state(include_fields(ExecutionState, fields))
 
 
 @router.post("/start")
@@ -174,6 +206,38 @@ async def intervene() -> dict[str, str]:
     return {"status": "ok"}
 
 
+# ------------------------------------------------------------------
+# Server-Sent Events endpoint
+# ------------------------------------------------------------------
+
+
+async def _execution_event_stream() -> AsyncIterator[str]:
+    """Yield the current state, then one SSE event per state change."""
+    queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=64)
+    _sse_queues.add(queue)
+    try:
+        yield f"data: {json.dumps(_current_state())}\n\n"
+        while True:
+            try:
+                state = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_S)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"data: {json.dumps(state)}\n\n"
+    finally:
+        _sse_queues.discard(queue)
+
+
+@router.get("/events")
+async def execution_events() -> StreamingResponse:
+    """Stream execution state changes as Server-Sent Events.
+
+    Lightweight alternative to polling ``/execution/state`` for clients
+    that cannot hold a WebSocket. Full path: /execution/events.
+    """
+    return StreamingResponse(_execution_event_stream(), media_type="text/event-stream")
+
+
 # ------------------------------------------------------------------
 # WebSocket endpoint
 # ------------------------------------------------------------------
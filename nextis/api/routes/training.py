@@ -8,11 +8,15 @@ in-memory and queryable via GET endpoints.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import uuid
+from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
+from nextis.api.routes._fields import include_fields
 from nextis.api.schemas import TrainingJobState, TrainRequest
 from nextis.errors import TrainingError
 from nextis.learning.dataset import StepDataset
@@ -25,6 +29,10 @@ router = APIRouter()
 # In-memory job registry.
 _jobs: dict[str, TrainingJobState] = {}
 
+# Job progress is updated in place, so the SSE stream samples it at this rate.
+SSE_SAMPLE_S = 0.1
+SSE_KEEPALIVE_S = 5.0
+
 
 async def _run_training(job: TrainingJobState, step_id: str, request: TrainRequest) -> None:
     """Background coroutine that runs the full training pipeline.
@@ -106,12 +114,52 @@ async def start_training(step_id: str, request: TrainRequest) -> TrainingJobStat
 
 
 @router.get("/jobs/{job_id}")
-async def get_training_job(job_id: str) -> TrainingJobState:
-    """Get the status of a training job."""
+async def get_training_job(
+    job_id: str,
+    fields: str | None = Query(
+        None, description="Comma-separated camelCase keys to return, e.g. status,progress"
+    ),
+) -> dict:
+    """Get the status of a training job.
+
+    With ``fields``, only those keys are serialized so status pollers get a
+    fixed-size payload.
+    """
     job = _jobs.get(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail=f"Training job '{job_id}' not found")
-    return job
+    return job.model_dump(by_alias=True, include=include_fields(TrainingJobState, fields))
+
+
+async def _job_event_stream(job: TrainingJobState) -> AsyncIterator[str]:
+    """Yield an SSE event whenever the job's status or progress changes.
+
+    Ends after the job reaches ``completed`` or ``failed``.
+    """
+    last: tuple[str, float] | None = None
+    idle = 0.0
+    while True:
+        current = (job.status, job.progress)
+        if current != last:
+            last = current
+            idle = 0.0
+            yield f"data: {json.dumps(job.model_dump(by_alias=True))}\n\n"
+            if job.status in ("completed", "failed"):
+                return
+        elif idle >= SSE_KEEPALIVE_S:
+            idle = 0.0
+            yield ": keepalive\n\n"
+        await asyncio.sleep(SSE_SAMPLE_S)
+        idle += SSE_SAMPLE_S
+
+
+@router.get("/jobs/{job_id}/events")
+async def training_job_events(job_id: str) -> StreamingResponse:
+    """Stream a training job's status changes as Server-Sent Events."""
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Training job '{job_id}' not found")
+    return StreamingResponse(_job_event_stream(job), media_type="text/event-stream")
 
 
 @router.get("/jobs", response_model=list[TrainingJobState])
@@ -125,19 +125,18 @@ def classify_geometry(
     Returns:
         Tuple of (geometry_type, dimensions) for the frontend PartMesh.
     """
-    sorted_dims = sorted([dx, dy, dz])
-    ratio = sorted_dims[2] / max(sorted_dims[0], 1e-9)
+    lo, mid, hi = sorted((dx, dy, dz))
+    lo_safe = max(lo, 1e-9)
+    ratio = hi / lo_safe
+    mid_ratio = mid / lo_safe
 
     # Equidimensional → sphere
-    if ratio < 1.3 and sorted_dims[1] / max(sorted_dims[0], 1e-9) < 1.3:
-        radius = max(dx, dy, dz) / 2
-        return "sphere", [radius]
+    if ratio < 1.3 and mid_ratio < 1.3:
+        return "sphere", [hi / 2]
 
     # One axis much longer, other two similar → cylinder
-    if ratio > 2.0 and sorted_dims[1] / max(sorted_dims[0], 1e-9) < 1.5:
-        radius = (sorted_dims[0] + sorted_dims[1]) / 4
-        height = sorted_dims[2]
-        return "cylinder", [radius, height]
+    if ratio > 2.0 and mid_ratio < 1.5:
+        return "cylinder", [(lo + mid) / 4, hi]
 
     return "box", [dx, dy, dz]
 
@@ -20,6 +20,14 @@ from nextis.learning.policy_loader import PolicyLoader
 
 logger = logging.getLogger(__name__)
 
+# Bound once to skip the attribute lookup on every step exit path.
+_perf_counter_ns = time.perf_counter_ns
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since ``start_ns`` (a ``perf_counter_ns`` reading)."""
+    return (_perf_counter_ns() - start_ns) / 1e6
+
 
 class PolicyRouter:
     """Routes assembly steps to the appropriate execution handler.
@@ -52,29 +60,29 @@ class PolicyRouter:
         Returns:
             StepResult with success/failure and timing.
         """
-        start_ms = time.monotonic() * 1000
+        start_ns = _perf_counter_ns()
 
         if step.handler == "primitive":
-            return await self._run_primitive(step, start_ms)
+            return await self._run_primitive(step, start_ns)
         if step.handler == "policy":
-            return await self._run_policy(step, start_ms)
+            return await self._run_policy(step, start_ns)
         if step.handler == "rl_finetune":
-            return await self._run_rl_policy(step, start_ms)
+            return await self._run_rl_policy(step, start_ns)
 
         logger.error("Unknown handler type '%s' for step %s", step.handler, step.id)
         return StepResult(
             success=False,
-            duration_ms=time.monotonic() * 1000 - start_ms,
+            duration_ms=_elapsed_ms(start_ns),
             handler_used=step.handler,
             error_message=f"Unknown handler: {step.handler}",
         )
 
-    async def _run_primitive(self, step: AssemblyStep, start_ms: float) -> StepResult:
+    async def _run_primitive(self, step: AssemblyStep, start_ns: int) -> StepResult:
         """Execute a primitive-type step."""
         if not step.primitive_type:
             return StepResult(
                 success=False,
-                duration_ms=time.monotonic() * 1000 - start_ms,
+                duration_ms=_elapsed_ms(start_ns),
                 handler_used="primitive",
                 error_message=f"Step {step.id} has no primitive_type set",
             )
@@ -103,19 +111,19 @@ class PolicyRouter:
                 mock_data = mock.generate_execution_data(step, force_success=step_result.success)
                 step_result.actual_force = mock_data.peak_force
                 step_result.actual_position = mock_data.final_position
-                step_result.force_history = [[f] for f in mock_data.force_history]
+                step_result.force_history = [[f] for f in mock_data.forces().tolist()]
 
             return step_result
         except Exception as e:
             logger.error("Primitive '%s' failed on step %s: %s", step.primitive_type, step.id, e)
             return StepResult(
                 success=False,
-                duration_ms=time.monotonic() * 1000 - start_ms,
+                duration_ms=_elapsed_ms(start_ns),
                 handler_used="primitive",
                 error_message=str(e),
             )
 
-    async def _run_policy(self, step: AssemblyStep, start_ms: float) -> StepResult:
+    async def _run_policy(self, step: AssemblyStep, start_ns: int) -> StepResult:
         """Execute a policy-type step using a trained checkpoint.
 
         Loads the policy via PolicyLoader, then runs an inference loop
@@ -131,7 +139,7 @@ class PolicyRouter:
             )
             return StepResult(
                 success=False,
-                duration_ms=time.monotonic() * 1000 - start_ms,
+                duration_ms=_elapsed_ms(start_ns),
                 handler_used="policy",
                 error_message=f"No trained policy for step {step.id}",
             )
@@ -151,16 +159,17 @@ class PolicyRouter:
                 robot = MockRobot()
 
             obs = robot.get_observation()
-            actions = policy.predict(obs)
+            # One forward pass yields the whole chunk; convert it to Python
+            # floats once rather than per action.
+            actions = policy.predict(obs).tolist()
             action_keys = policy.joint_keys or sorted(obs.keys())
 
             for i in range(policy.chunk_size):
                 action = actions[min(i, len(actions) - 1)]
-                action_dict = dict(zip(action_keys, action, strict=False))
-                robot.send_action(action_dict)
+                robot.send_action(dict(zip(action_keys, action, strict=False)))
                 await asyncio.sleep(1 / 50)  # 50 Hz control rate
 
-            elapsed = time.monotonic() * 1000 - start_ms
+            elapsed = _elapsed_ms(start_ns)
 
             # In mock mode, generate realistic telemetry for the verifier.
             if self._robot is None:
@@ -171,7 +180,7 @@ class PolicyRouter:
                     handler_used="policy",
                     actual_force=mock_data.peak_force,
                     actual_position=mock_data.final_position,
-                    force_history=[[f] for f in mock_data.force_history],
+                    force_history=[[f] for f in mock_data.forces().tolist()],
                 )
 
             return StepResult(
@@ -184,12 +193,12 @@ class PolicyRouter:
             logger.error("Policy inference failed on step %s: %s", step.id, e)
             return StepResult(
                 success=False,
-                duration_ms=time.monotonic() * 1000 - start_ms,
+                duration_ms=_elapsed_ms(start_ns),
                 handler_used="policy",
                 error_message=str(e),
             )
 
-    async def _run_rl_policy(self, step: AssemblyStep, start_ms: float) -> StepResult:
+    async def _run_rl_policy(self, step: AssemblyStep, start_ns: int) -> StepResult:
         """Execute a step using an RL-finetuned SAC policy.
 
         Loads the SAC agent from ``policy_rl.pt``. If no RL checkpoint exists,
@@ -204,7 +213,7 @@ class PolicyRouter:
                 "No RL checkpoint for step %s, falling back to BC policy",
                 step.id,
             )
-            return await self._run_policy(step, start_ms)
+            return await self._run_policy(step, start_ns)
 
         try:
             import numpy as np
@@ -231,7 +240,7 @@ class PolicyRouter:
                 robot.send_action(joints_to_action(action.tolist()))
                 await asyncio.sleep(1 / 50)
 
-            elapsed = time.monotonic() * 1000 - start_ms
+            elapsed = _elapsed_ms(start_ns)
 
             # In mock mode, generate realistic telemetry for the verifier.
             if self._robot is None:
@@ -242,7 +251,7 @@ class PolicyRouter:
                     handler_used="rl_finetune",
                     actual_force=mock_data.peak_force,
                     actual_position=mock_data.final_position,
-                    force_history=[[f] for f in mock_data.force_history],
+                    force_history=[[f] for f in mock_data.forces().tolist()],
                 )
 
             return StepResult(
@@ -255,7 +264,7 @@ class PolicyRouter:
             logger.error("RL policy inference failed on step %s: %s", step.id, e)
             return StepResult(
                 success=False,
-                duration_ms=time.monotonic() * 1000 - start_ms,
+                duration_ms=_elapsed_ms(start_ns),
                 handler_used="rl_finetune",
                 error_message=str(e),
             )
@@ -35,7 +35,7 @@ class ConnectionStatus(str, Enum):  # noqa: UP042
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ArmDefinition:
     """Configuration for a single robotic arm.
 
@@ -76,7 +76,7 @@ class ArmDefinition:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Pairing:
     """A leader-follower arm pairing for teleoperation.
 
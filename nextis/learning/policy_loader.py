@@ -63,8 +63,24 @@ class Policy:
         """
         keys = self._config.get("joint_keys") or sorted(observation)
         obs_array = np.array([observation[k] for k in keys], dtype=np.float32)
-        with torch.no_grad():
-            obs_tensor = torch.tensor(obs_array).unsqueeze(0)
+        return self.predict_vec(obs_array)
+
+    def predict_vec(self, observation: np.ndarray) -> np.ndarray:
+        """Run inference on an observation vector.
+
+        Skips the dict lookup of ``predict()`` for callers that already hold
+        the observation as an array.
+
+        Args:
+            observation: Array of shape ``(obs_dim,)``, ordered like
+                ``joint_keys``.
+
+        Returns:
+            Action array of shape ``(chunk_size, action_dim)``.
+        """
+        obs_array = np.asarray(observation, dtype=np.float32)
+        with torch.inference_mode():
+            obs_tensor = torch.from_numpy(obs_array).unsqueeze(0)
             actions = self._model(obs_tensor)
         return actions[0].numpy()  # (chunk_size, action_dim)
 
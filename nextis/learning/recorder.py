@@ -8,6 +8,7 @@ step.  Each demo captures ``observation/joint_positions``,
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
@@ -32,6 +33,8 @@ except ImportError:
 
 DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "demos"
 RECORDING_HZ = 50
+# Frames preallocated per recording (30 s at 50 Hz); the buffer doubles if exceeded.
+INITIAL_CAPACITY = 30 * RECORDING_HZ
 
 
 @dataclass
@@ -47,22 +50,82 @@ class DemoMetadata:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
-class _Frame:
-    """Single timestamped observation frame (internal)."""
+class _FrameBuffer:
+    """Column-wise frame storage, preallocated and grown by doubling (internal).
 
-    timestamp: float
-    joint_positions: dict[str, float]
-    gripper_state: float
-    force_torque: dict[str, float]
-    action_positions: dict[str, float]
+    Each signal lives in its own float32 array so :meth:`DemoRecorder.stop`
+    writes whole columns to HDF5 without re-walking per-frame dicts. Column
+    order is fixed by the first frame's (sorted) keys; keys missing from a
+    later frame are recorded as 0.0.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.n = 0
+        self._capacity = capacity
+        self.joint_keys: list[str] = []
+        self.action_keys: list[str] = []
+        self.torque_keys: list[str] = []
+        self.timestamps = np.empty(0, dtype=np.float64)
+        self.joint_positions = np.empty((0, 0), dtype=np.float32)
+        self.gripper_state = np.empty(0, dtype=np.float32)
+        self.force_torque = np.empty((0, 0), dtype=np.float32)
+        self.action_positions = np.empty((0, 0), dtype=np.float32)
+
+    def append(
+        self,
+        timestamp: float,
+        joint_positions: dict[str, float],
+        gripper_state: float,
+        force_torque: dict[str, float],
+        action_positions: dict[str, float],
+    ) -> None:
+        """Store one frame, allocating on the first and growing when full."""
+        if self.n == 0:
+            self._allocate(joint_positions, action_positions, force_torque)
+        elif self.n == len(self.timestamps):
+            self._grow()
+
+        i = self.n
+        self.timestamps[i] = timestamp
+        self.joint_positions[i] = [joint_positions.get(k, 0.0) for k in self.joint_keys]
+        self.gripper_state[i] = gripper_state
+        self.force_torque[i] = [force_torque.get(k, 0.0) for k in self.torque_keys]
+        self.action_positions[i] = [action_positions.get(k, 0.0) for k in self.action_keys]
+        self.n += 1
+
+    def _allocate(
+        self,
+        joint_positions: dict[str, float],
+        action_positions: dict[str, float],
+        force_torque: dict[str, float],
+    ) -> None:
+        self.joint_keys = sorted(joint_positions)
+        self.action_keys = sorted(action_positions)
+        self.torque_keys = sorted(force_torque)
+        cap = self._capacity
+        self.timestamps = np.empty(cap, dtype=np.float64)
+        self.joint_positions = np.empty((cap, len(self.joint_keys)), dtype=np.float32)
+        self.gripper_state = np.empty(cap, dtype=np.float32)
+        self.force_torque = np.empty((cap, len(self.torque_keys)), dtype=np.float32)
+        self.action_positions = np.empty((cap, len(self.action_keys)), dtype=np.float32)
+
+    def _grow(self) -> None:
+        for name in (
+            "timestamps",
+            "joint_positions",
+            "gripper_state",
+            "force_torque",
+            "action_positions",
+        ):
+            arr = getattr(self, name)
+            setattr(self, name, np.concatenate([arr, np.empty_like(arr)]))
 
 
 class DemoRecorder:
     """Records teleoperation demonstrations for a specific assembly step.
 
-    Captures at 50 Hz in a background thread.  Data is buffered in memory
-    and flushed to HDF5 when :meth:`stop` is called.
+    Captures at 50 Hz in a background thread.  Data is buffered in
+    preallocated NumPy columns and flushed to HDF5 when :meth:`stop` is called.
 
     Args:
         assembly_id: ID of the assembly being demonstrated.
@@ -83,7 +146,7 @@ class DemoRecorder:
         self._step_id = step_id
         self._data_dir = data_dir
 
-        self._frames: list[_Frame] = []
+        self._frames = _FrameBuffer(INITIAL_CAPACITY)
         self._is_recording = False
         self._thread: threading.Thread | None = None
         self._start_time: float = 0.0
@@ -110,7 +173,7 @@ class DemoRecorder:
     @property
     def frame_count(self) -> int:
         """Number of frames recorded so far."""
-        return len(self._frames)
+        return self._frames.n
 
     # -- Public API ----------------------------------------------------------
 
@@ -135,7 +198,7 @@ class DemoRecorder:
 
         self._is_recording = True
         self._start_time = time.monotonic()
-        self._frames = []
+        self._frames = _FrameBuffer(INITIAL_CAPACITY)
 
         self._thread = threading.Thread(
             target=self._record_loop,
@@ -175,7 +238,7 @@ class DemoRecorder:
             assembly_id=self._assembly_id,
             step_id=self._step_id,
             file_path=self._file_path,
-            num_frames=len(self._frames),
+            num_frames=self._frames.n,
             duration_s=round(duration, 2),
             timestamp=self._timestamp,
         )
@@ -187,6 +250,35 @@ class DemoRecorder:
         )
         return metadata
 
+    async def wait_for_frames(self, n: int, timeout: float = 2.0) -> int:
+        """Wait until at least ``n`` frames have been captured.
+
+        Returns as soon as the capture thread delivers the frames, rather than
+        after a fixed sleep sized for the slowest machine.
+
+        Args:
+            n: Minimum number of frames to wait for.
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            The frame count when the wait ended (always >= ``n``).
+
+        Raises:
+            RecordingError: If not recording, or fewer than ``n`` frames
+                arrived within ``timeout``.
+        """
+        if not self._is_recording:
+            raise RecordingError("No active recording to wait on")
+
+        deadline = time.monotonic() + timeout
+        while self._frames.n < n:
+            if time.monotonic() >= deadline:
+                raise RecordingError(
+                    f"Timed out waiting for {n} frames ({self._frames.n} after {timeout}s)"
+                )
+            await asyncio.sleep(0.5 / RECORDING_HZ)
+        return self._frames.n
+
     def discard(self) -> None:
         """Stop recording (if active) and delete the output file."""
         if self._is_recording:
@@ -198,7 +290,7 @@ class DemoRecorder:
             self._file_path.unlink()
             logger.info("Discarded recording: %s", self._file_path)
 
-        self._frames = []
+        self._frames = _FrameBuffer(INITIAL_CAPACITY)
 
     # -- Internal ------------------------------------------------------------
 
@@ -225,16 +317,14 @@ class DemoRecorder:
                         break
 
                 self._frames.append(
-                    _Frame(
-                        timestamp=time.time(),
-                        joint_positions=obs,
-                        gripper_state=gripper_val,
-                        force_torque=torques,
-                        action_positions=action,
-                    )
+                    timestamp=time.time(),
+                    joint_positions=obs,
+                    gripper_state=gripper_val,
+                    force_torque=torques,
+                    action_positions=action,
                 )
             except Exception as e:
-                if len(self._frames) % RECORDING_HZ == 0:
+                if self._frames.n % RECORDING_HZ == 0:
                     logger.warning("Recording frame error: %s", e)
 
             elapsed = time.perf_counter() - loop_start
@@ -242,19 +332,14 @@ class DemoRecorder:
 
     def _flush_to_hdf5(self) -> None:
         """Write buffered frames to an HDF5 file."""
-        if not self._frames:
+        frames = self._frames
+        n = frames.n
+        if n == 0:
             logger.warning("No frames to flush")
             return
 
         self._output_dir.mkdir(parents=True, exist_ok=True)
 
-        joint_keys = sorted(self._frames[0].joint_positions.keys())
-        action_keys = sorted(self._frames[0].action_positions.keys())
-        torque_keys = (
-            sorted(self._frames[0].force_torque.keys()) if self._frames[0].force_torque else []
-        )
-        n = len(self._frames)
-
         with h5py.File(str(self._file_path), "w") as f:
             f.attrs["assembly_id"] = self._assembly_id
             f.attrs["step_id"] = self._step_id
@@ -263,40 +348,21 @@ class DemoRecorder:
             f.attrs["recording_hz"] = RECORDING_HZ
             f.attrs["timestamp"] = self._timestamp
 
-            f.create_dataset(
-                "timestamps",
-                data=np.array([fr.timestamp for fr in self._frames]),
-            )
+            f.create_dataset("timestamps", data=frames.timestamps[:n])
 
             # Observations
             obs_grp = f.create_group("observation")
-            jp = np.zeros((n, len(joint_keys)), dtype=np.float32)
-            for i, fr in enumerate(self._frames):
-                for j, k in enumerate(joint_keys):
-                    jp[i, j] = fr.joint_positions.get(k, 0.0)
-            obs_grp.create_dataset("joint_positions", data=jp)
-            obs_grp.attrs["joint_keys"] = joint_keys
-
-            obs_grp.create_dataset(
-                "gripper_state",
-                data=np.array([fr.gripper_state for fr in self._frames], dtype=np.float32),
-            )
-
-            if torque_keys:
-                ft = np.zeros((n, len(torque_keys)), dtype=np.float32)
-                for i, fr in enumerate(self._frames):
-                    for j, k in enumerate(torque_keys):
-                        ft[i, j] = fr.force_torque.get(k, 0.0)
-                obs_grp.create_dataset("force_torque", data=ft)
-                obs_grp.attrs["torque_keys"] = torque_keys
+            obs_grp.create_dataset("joint_positions", data=frames.joint_positions[:n])
+            obs_grp.attrs["joint_keys"] = frames.joint_keys
+            obs_grp.create_dataset("gripper_state", data=frames.gripper_state[:n])
+
+            if frames.torque_keys:
+                obs_grp.create_dataset("force_torque", data=frames.force_torque[:n])
+                obs_grp.attrs["torque_keys"] = frames.torque_keys
 
             # Actions
             act_grp = f.create_group("action")
-            ap = np.zeros((n, len(action_keys)), dtype=np.float32)
-            for i, fr in enumerate(self._frames):
-                for j, k in enumerate(action_keys):
-                    ap[i, j] = fr.action_positions.get(k, 0.0)
-            act_grp.create_dataset("joint_positions", data=ap)
-            act_grp.attrs["joint_keys"] = action_keys
+            act_grp.create_dataset("joint_positions", data=frames.action_positions[:n])
+            act_grp.attrs["joint_keys"] = frames.action_keys
 
         logger.info("Flushed %d frames to %s", n, self._file_path)
@@ -51,7 +51,7 @@ class StepRewardComputer:
         obs: np.ndarray,
         action: np.ndarray,
         torques: list[float],
-        force_history: list[float],
+        force_history: np.ndarray,
     ) -> float:
         """Compute dense shaping reward for a single timestep.
 
@@ -290,7 +290,9 @@ class StepRLTrainer:
 
         total_reward = 0.0
         interventions = 0
-        force_history: list[float] = []
+        # Preallocated per-episode force buffer; only the first force_count are valid.
+        force_history = np.empty(self._config.max_steps_per_episode, dtype=np.float32)
+        force_count = 0
 
         # Get initial observation
         obs_list = obs_to_joints(self._robot.get_observation())
@@ -325,11 +327,12 @@ class StepRLTrainer:
             # Read telemetry
             torques = read_torques_list(self._robot)
             peak_torque = max(abs(t) for t in torques) if torques else 0.0
-            force_history.append(peak_torque)
+            force_history[force_count] = peak_torque
+            force_count += 1
 
             # Compute dense reward
             dense = self._reward.compute_timestep_reward(
-                obs_array, safe_action, torques, force_history
+                obs_array, safe_action, torques, force_history[:force_count]
             )
             total_reward += dense
 
@@ -355,12 +358,14 @@ class StepRLTrainer:
             await asyncio.sleep(1.0 / self._config.control_hz)
 
         # Terminal reward
+        forces = force_history[:force_count]
         exec_data = ExecutionData(
             final_position=obs_list,
             force_history=force_history,
-            peak_force=max(force_history) if force_history else 0.0,
-            final_force=force_history[-1] if force_history else 0.0,
-            duration_ms=len(force_history) * (1000.0 / self._config.control_hz),
+            force_count=force_count,
+            peak_force=float(forces.max()) if force_count else 0.0,
+            final_force=float(forces[-1]) if force_count else 0.0,
+            duration_ms=force_count * (1000.0 / self._config.control_hz),
         )
         terminal = await self._reward.compute_terminal_reward(exec_data)
         total_reward += terminal
@@ -379,7 +384,7 @@ class StepRLTrainer:
                 )
             )
 
-        return total_reward, len(force_history), interventions, success
+        return total_reward, force_count, interventions, success
 
     def _do_sac_updates(self, num_updates: int) -> dict[str, float]:
         """Perform SAC gradient updates between episodes.
@@ -12,8 +12,13 @@ Checkers:
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
+import math
+import os
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
@@ -25,6 +30,12 @@ logger = logging.getLogger(__name__)
 # Default position tolerance in mm.
 _DEFAULT_POSITION_TOLERANCE_MM = 2.0
 
+# Position and force-threshold results are pure functions of a few scalars, so
+# re-verifying the same trace hits an LRU cache. NEXTIS_CHECK_CACHE=0 disables it
+# (maxsize=0) for long production runs where every input is new. Callers get a
+# copy of the cached result, so mutating it cannot leak into later checks.
+_CHECK_CACHE_SIZE = 512 if os.environ.get("NEXTIS_CHECK_CACHE", "1") != "0" else 0
+
 
 # ------------------------------------------------------------------
 # 1. Position check
@@ -61,12 +72,18 @@ def check_position(step: AssemblyStep, data: ExecutionData) -> VerificationResul
             detail="No final position data available for verification",
         )
 
-    target_xyz = np.array(target_pose[:3], dtype=np.float64)
-    actual_xyz = np.array(data.final_position[:3], dtype=np.float64)
-    distance = float(np.linalg.norm(target_xyz - actual_xyz))
-
     tolerance = step.success_criteria.threshold or _DEFAULT_POSITION_TOLERANCE_MM
+    tx, ty, tz = (float(v) for v in target_pose[:3])
+    ax, ay, az = (float(v) for v in data.final_position[:3])
+    return dataclasses.replace(_check_position_cached(tx, ty, tz, ax, ay, az, float(tolerance)))
 
+
+@functools.lru_cache(maxsize=_CHECK_CACHE_SIZE)
+def _check_position_cached(
+    tx: float, ty: float, tz: float, ax: float, ay: float, az: float, tolerance: float
+) -> VerificationResult:
+    """Memoized core of ``check_position`` over hashable scalar inputs."""
+    distance = math.dist((tx, ty, tz), (ax, ay, az))
     passed = distance <= tolerance
     return VerificationResult(
         passed=passed,
@@ -100,12 +117,20 @@ def check_force_threshold(step: AssemblyStep, data: ExecutionData) -> Verificati
             detail="No force threshold defined — skipping",
         )
 
-    passed = data.peak_force >= threshold
+    return dataclasses.replace(
+        _check_force_threshold_cached(float(data.peak_force), float(threshold))
+    )
+
+
+@functools.lru_cache(maxsize=_CHECK_CACHE_SIZE)
+def _check_force_threshold_cached(peak_force: float, threshold: float) -> VerificationResult:
+    """Memoized core of ``check_force_threshold`` over hashable scalar inputs."""
+    passed = peak_force >= threshold
     return VerificationResult(
         passed=passed,
         confidence=0.95 if passed else 0.9,
-        detail=f"Peak force: {data.peak_force:.2f}N (threshold: {threshold:.2f}N)",
-        measured_value=data.peak_force,
+        detail=f"Peak force: {peak_force:.2f}N (threshold: {threshold:.2f}N)",
+        measured_value=peak_force,
         threshold=threshold,
     )
 
@@ -115,6 +140,26 @@ def check_force_threshold(step: AssemblyStep, data: ExecutionData) -> Verificati
 # ------------------------------------------------------------------
 
 
+# Samples after the peak in which a snap-fit drop must occur.
+_SNAP_FIT_DROP_WINDOW = 5
+
+
+def _snap_fit_features(force: np.ndarray) -> tuple[float, float | None]:
+    """Peak value and the minimum within the drop window after it.
+
+    One full-buffer pass (argmax) plus a bounded window scan; the peak value is
+    read back by index rather than with a second reduction.
+
+    Returns:
+        Tuple of (peak_value, min_after_peak), with None when the peak is the
+        last sample.
+    """
+    peak_idx = int(force.argmax())
+    window = force[peak_idx + 1 : peak_idx + 1 + _SNAP_FIT_DROP_WINDOW]
+    min_after = float(window.min()) if len(window) else None
+    return float(force[peak_idx]), min_after
+
+
 def _detect_snap_fit(force: np.ndarray, threshold: float | None) -> VerificationResult:
     """Snap-fit: peak followed by sharp drop (>50%) within 5 samples, then hold."""
     if len(force) < 10:
@@ -122,8 +167,7 @@ def _detect_snap_fit(force: np.ndarray, threshold: float | None) -> Verification
             passed=False, confidence=0.4, detail="Force history too short for snap-fit detection"
         )
 
-    peak_idx = int(np.argmax(force))
-    peak_val = float(force[peak_idx])
+    peak_val, min_after_peak = _snap_fit_features(force)
 
     if peak_val < 0.1:
         return VerificationResult(
@@ -131,14 +175,11 @@ def _detect_snap_fit(force: np.ndarray, threshold: float | None) -> Verification
         )
 
     # Look for >50% drop within next 5 samples after peak
-    window_end = min(peak_idx + 6, len(force))
-    post_peak = force[peak_idx + 1 : window_end]
-    if len(post_peak) == 0:
+    if min_after_peak is None:
         return VerificationResult(
             passed=False, confidence=0.5, detail="Peak at end of force history — no drop detected"
         )
 
-    min_after_peak = float(np.min(post_peak))
     drop_ratio = (peak_val - min_after_peak) / peak_val if peak_val > 0 else 0
 
     passed = drop_ratio > 0.5
@@ -229,12 +270,14 @@ def check_force_signature(step: AssemblyStep, data: ExecutionData) -> Verificati
             detail="No force signature pattern defined — skipping",
         )
 
-    if not data.force_history:
+    # The detectors' ratio and threshold comparisons run in float64, as before
+    # force_history became a float32 buffer.
+    force = data.forces().astype(np.float64, copy=False)
+    if len(force) == 0:
         return VerificationResult(
             passed=False, confidence=0.6, detail="No force history data for signature analysis"
         )
 
-    force = np.array(data.force_history, dtype=np.float64)
     threshold = step.success_criteria.threshold
 
     detectors = {
@@ -259,6 +302,33 @@ def check_force_signature(step: AssemblyStep, data: ExecutionData) -> Verificati
 # ------------------------------------------------------------------
 
 
+# Classifier input resolution (square RGB frames).
+_CLASSIFIER_INPUT_SIZE = 224
+
+
+@functools.lru_cache(maxsize=8)
+def _load_classifier(model_path: str, mtime_ns: int) -> Any:
+    """Load a classifier checkpoint once and keep it in eval mode.
+
+    Keyed on the file's mtime so a retrained checkpoint is picked up. The
+    eager module is cached as-is; it is not traced, since tracing silently
+    bakes in whichever branch data-dependent control flow takes on the
+    example input.
+
+    Args:
+        model_path: Path to the pickled PyTorch model.
+        mtime_ns: Modification time of ``model_path``, used as a cache key.
+
+    Returns:
+        The loaded model in eval mode.
+    """
+    import torch
+
+    model = torch.load(model_path, map_location="cpu", weights_only=False)
+    model.eval()
+    return model
+
+
 def check_classifier(step: AssemblyStep, data: ExecutionData) -> VerificationResult:
     """Run a trained image classifier to verify step completion.
 
@@ -309,16 +379,16 @@ def check_classifier(step: AssemblyStep, data: ExecutionData) -> VerificationRes
         )
 
     try:
-        model = torch.load(str(model_path), map_location="cpu", weights_only=False)
-        model.eval()
+        model = _load_classifier(str(model_path), model_path.stat().st_mtime_ns)
 
         # Resize to 224x224 and normalize
+        size = _CLASSIFIER_INPUT_SIZE
         frame = data.camera_frame
-        if frame.shape[:2] != (224, 224):
+        if frame.shape[:2] != (size, size):
             # Simple resize via nearest-neighbor (no PIL dependency)
             h, w = frame.shape[:2]
-            y_indices = (np.arange(224) * h / 224).astype(int)
-            x_indices = (np.arange(224) * w / 224).astype(int)
+            y_indices = (np.arange(size) * h / size).astype(int)
+            x_indices = (np.arange(size) * w / size).astype(int)
             frame = frame[np.ix_(y_indices, x_indices)]
 
         # HWC uint8 → CHW float32 normalized to [0, 1]
@@ -328,13 +398,16 @@ def check_classifier(step: AssemblyStep, data: ExecutionData) -> VerificationRes
         with torch.no_grad():
             output = model(tensor)
 
-        # Binary classifier: sigmoid output, threshold at 0.5
+        # Binary classifier: the logit sign decides pass/fail (sigmoid >= 0.5 iff
+        # logit >= 0); the probability is only needed for the confidence field.
         if output.shape[-1] == 1:
-            prob = float(torch.sigmoid(output[0, 0]))
+            logit = float(output[0, 0])
+            passed = logit >= 0.0
+            prob = 0.5 + 0.5 * math.tanh(logit / 2)
         else:
             prob = float(torch.softmax(output[0], dim=0)[1])
+            passed = prob >= 0.5
 
-        passed = prob >= 0.5
         return VerificationResult(
             passed=passed,
             confidence=prob if passed else 1.0 - prob,
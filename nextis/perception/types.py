@@ -10,13 +10,19 @@ from dataclasses import dataclass, field
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionData:
     """Telemetry snapshot captured after step dispatch.
 
+    ``force_history`` is a float32 sample buffer of which only the first
+    ``force_count`` entries are valid, so producers can preallocate it and fill
+    it in place. Plain lists are accepted and converted on construction.
+
     Attributes:
         final_position: End-effector position at step completion (xyz + optional orientation).
         force_history: Time-series of force magnitudes during execution (N).
+        force_count: Number of valid samples in force_history. The default (-1)
+            means all of it and is replaced by its length on construction.
         peak_force: Maximum force observed during execution (N).
         final_force: Force at step completion (N).
         camera_frame: RGB image from workspace camera (H, W, 3) uint8, or None.
@@ -24,14 +30,24 @@ class ExecutionData:
     """
 
     final_position: list[float] = field(default_factory=list)
-    force_history: list[float] = field(default_factory=list)
+    force_history: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    force_count: int = -1
     peak_force: float = 0.0
     final_force: float = 0.0
     camera_frame: np.ndarray | None = None
     duration_ms: float = 0.0
 
+    def __post_init__(self) -> None:
+        self.force_history = np.asarray(self.force_history, dtype=np.float32)
+        if self.force_count < 0:
+            self.force_count = len(self.force_history)
+
+    def forces(self) -> np.ndarray:
+        """Return a view of the valid force samples (no copy)."""
+        return self.force_history[: self.force_count]
+
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Output from a verification checker.
 
@@ -1,4 +1,14 @@
-"""Start the AURA API server."""
+"""Start the AURA API server.
+
+Development (default) runs with auto-reload. To serve without the file
+watcher:
+
+    AURA_RELOAD=0 python scripts/run_api.py
+
+The server always runs a single worker process: the sequencer, training jobs,
+SSE subscriber queues and recorder/teleop state live in module globals, so a
+second worker would not see jobs or state changes made by the first.
+"""
 
 import os
 import sys
@@ -7,10 +17,21 @@ from pathlib import Path
 # Ensure the project root is on PYTHONPATH so uvicorn's reloader subprocess
 # can find the nextis package.
 PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
-sys.path.insert(0, PROJECT_ROOT)
-os.environ["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+# Idempotent: reloader subprocesses inherit the variable and must not re-prepend.
+_pythonpath = [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+if PROJECT_ROOT not in _pythonpath:
+    os.environ["PYTHONPATH"] = os.pathsep.join([PROJECT_ROOT, *_pythonpath])
 
 import uvicorn  # noqa: E402
 
 if __name__ == "__main__":
-    uvicorn.run("nextis.api.app:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "nextis.api.app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=os.environ.get("AURA_RELOAD", "1") == "1",
+        # Single process only: API state is held in per-process module globals.
+        workers=1,
+    )
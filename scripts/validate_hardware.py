@@ -21,10 +21,19 @@ import sys
 from datetime import UTC, datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional — faster serialization than stdlib json.
+    orjson = None
+
 # Ensure project root is on PYTHONPATH
 PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
-sys.path.insert(0, PROJECT_ROOT)
-os.environ["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+# Idempotent: child processes inherit the variable and must not re-prepend it.
+_pythonpath = [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+if PROJECT_ROOT not in _pythonpath:
+    os.environ["PYTHONPATH"] = os.pathsep.join([PROJECT_ROOT, *_pythonpath])
 
 from nextis.control.motion_helpers import PrimitiveResult  # noqa: E402
 from nextis.control.primitives import PrimitiveLibrary  # noqa: E402
@@ -161,21 +170,25 @@ def _write_summary(arm_id: str, results: list[dict]) -> Path:
     output_dir = Path("data/hardware_validation")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%S")
+    # One clock read so the filename and the payload timestamp always agree.
+    now = datetime.now(tz=UTC)
+    timestamp = now.strftime("%Y%m%dT%H%M%S")
     output_path = output_dir / f"{arm_id}_{timestamp}.json"
 
     overall_pass = all(r["success"] for r in results)
     summary = {
         "arm_id": arm_id,
-        "timestamp": datetime.now(tz=UTC).isoformat(),
+        "timestamp": now.isoformat(),
         "results": results,
         "overall_pass": overall_pass,
     }
 
-    with open(output_path, "w") as f:
-        json.dump(summary, f, indent=2)
-        f.write("\n")
+    if orjson is not None:
+        payload = orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(summary, indent=2) + "\n").encode()
 
+    output_path.write_bytes(payload)
     return output_path
 
 
@@ -208,34 +221,47 @@ async def _run_validation(args: argparse.Namespace) -> bool:
     library = PrimitiveLibrary()
     results: list[dict] = []
 
-    for step in VALIDATION_STEPS:
+    outcomes: list[PrimitiveResult | BaseException]
+    if robot is None:
+        # Mock primitives share no hardware state, so they can run concurrently.
+        logger.info("--- Running %d mock primitives concurrently ---", len(VALIDATION_STEPS))
+        outcomes = await asyncio.gather(
+            *(library.run(s["primitive"], None, s["params"]) for s in VALIDATION_STEPS),
+            return_exceptions=True,
+        )
+    else:
+        # Real hardware: each primitive starts from where the previous one left off.
+        outcomes = []
+        for step in VALIDATION_STEPS:
+            logger.info("--- Running: %s (primitive=%s) ---", step["name"], step["primitive"])
+            try:
+                outcomes.append(await library.run(step["primitive"], robot, step["params"]))
+            except Exception as exc:
+                outcomes.append(exc)
+
+    lines: list[str] = []
+    for step, outcome in zip(VALIDATION_STEPS, outcomes, strict=True):
         step_name = step["name"]
-        primitive = step["primitive"]
-        params = step["params"]
-
-        logger.info("--- Running: %s (primitive=%s) ---", step_name, primitive)
-
-        try:
-            result = await library.run(primitive, robot, params)
-        except Exception as exc:
-            logger.error("Primitive '%s' raised exception: %s", step_name, exc)
+        if isinstance(outcome, BaseException):
+            logger.error("Primitive '%s' raised exception: %s", step_name, outcome)
             result = PrimitiveResult(
                 success=False,
-                error_message=str(exc),
+                error_message=str(outcome),
             )
+        else:
+            result = outcome
 
         summary = _format_result(step_name, result)
         results.append(summary)
 
         status = "PASS" if result.success else "FAIL"
-        logger.info(
-            "  %s | duration=%.1fms | force=%.4f | error=%s",
-            status,
-            result.duration_ms,
-            result.actual_force,
-            result.error_message or "none",
+        lines.append(
+            f"  {step_name} | {status} | duration={result.duration_ms:.1f}ms"
+            f" | force={result.actual_force:.4f} | error={result.error_message or 'none'}"
         )
 
+    logger.info("Results:\n%s", "\n".join(lines))
+
     # Disconnect mock robot if applicable
     if hasattr(robot, "disconnect"):
         robot.disconnect()
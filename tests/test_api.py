@@ -6,6 +6,7 @@ isolating each test from real data on disk.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -175,6 +176,11 @@ def test_404_missing_assembly(isolated_app: TestClient) -> None:
     assert r.status_code == 404
 
 
+def test_head_assembly(isolated_app: TestClient) -> None:
+    assert isolated_app.head("/assemblies/test_assembly").status_code == 200
+    assert isolated_app.head("/assemblies/nonexistent").status_code == 404
+
+
 # ------------------------------------------------------------------
 # Execution routes
 # ------------------------------------------------------------------
@@ -188,3 +194,90 @@ def test_start_execution(isolated_app: TestClient) -> None:
     r2 = isolated_app.get("/execution/state")
     assert r2.json()["phase"] in ("running", "complete")
     assert r2.json()["assemblyId"] == "test_assembly"
+
+
+def test_execution_state_fields(isolated_app: TestClient) -> None:
+    r = isolated_app.get("/execution/state", params={"fields": "phase,currentStepId"})
+    assert r.status_code == 200
+    assert r.json() == {"phase": "idle", "currentStepId": None}
+
+
+async def test_execution_events_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    import nextis.api.routes.execution as exec_mod
+    from nextis.api.schemas import ExecutionState
+
+    monkeypatch.setattr(exec_mod, "_sequencer", None)
+    monkeypatch.setattr(exec_mod, "_sse_queues", set())
+
+    stream = exec_mod._execution_event_stream()
+    try:
+        first = await anext(stream)
+        assert json.loads(first[6:])["phase"] == "idle"
+        assert len(exec_mod._sse_queues) == 1
+
+        exec_mod._broadcast_state(ExecutionState(phase="running", current_step_id="step_001"))
+        event = json.loads((await anext(stream))[6:])
+        assert event["phase"] == "running"
+        assert event["currentStepId"] == "step_001"
+    finally:
+        await stream.aclose()
+
+    # Unsubscribes on disconnect
+    assert not exec_mod._sse_queues
+
+
+async def test_execution_events_drop_oldest(monkeypatch: pytest.MonkeyPatch) -> None:
+    import nextis.api.routes.execution as exec_mod
+    from nextis.api.schemas import ExecutionState
+
+    monkeypatch.setattr(exec_mod, "_sse_queues", set())
+    queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=2)
+    exec_mod._sse_queues.add(queue)
+
+    for run in range(3):
+        exec_mod._broadcast_state(ExecutionState(phase="running", run_number=run))
+
+    # A slow subscriber keeps the newest snapshots; run 0 was dropped
+    assert [queue.get_nowait()["runNumber"] for _ in range(queue.qsize())] == [1, 2]
+
+
+# ------------------------------------------------------------------
+# Training routes
+# ------------------------------------------------------------------
+
+
+def test_training_job_events_stream(
+    isolated_app: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import nextis.api.routes.training as training_mod
+    from nextis.api.schemas import TrainingJobState
+
+    job = TrainingJobState(job_id="job123", step_id="step_001", status="completed", progress=1.0)
+    monkeypatch.setitem(training_mod._jobs, "job123", job)
+
+    with isolated_app.stream("GET", "/training/jobs/job123/events") as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/event-stream")
+        events = [json.loads(line[6:]) for line in r.iter_lines() if line.startswith("data: ")]
+
+    assert len(events) == 1
+    assert events[0]["jobId"] == "job123"
+    assert events[0]["status"] == "completed"
+
+
+def test_training_job_events_missing_job(isolated_app: TestClient) -> None:
+    r = isolated_app.get("/training/jobs/nonexistent/events")
+    assert r.status_code == 404
+
+
+def test_training_job_fields(isolated_app: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    import nextis.api.routes.training as training_mod
+    from nextis.api.schemas import TrainingJobState
+
+    job = TrainingJobState(job_id="job123", step_id="step_001", status="running", progress=0.5)
+    monkeypatch.setitem(training_mod._jobs, "job123", job)
+
+    r = isolated_app.get("/training/jobs/job123", params={"fields": "status,progress"})
+    assert r.status_code == 200
+    assert r.json() == {"status": "running", "progress": 0.5}
+    assert isolated_app.get("/training/jobs/job123").json()["jobId"] == "job123"
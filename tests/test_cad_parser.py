@@ -6,6 +6,7 @@ All tests are skipped automatically when neither is available.
 
 from __future__ import annotations
 
+import dataclasses
 from pathlib import Path
 
 import pytest
@@ -40,15 +41,26 @@ except ImportError:
     except ImportError:
         _occ_available = False
 
-pytestmark = pytest.mark.skipif(not _occ_available, reason="OCP/pythonocc-core not installed")
+from nextis.assembly.cad_parser import CADParser, ParseResult  # noqa: E402
+from nextis.assembly.mesh_utils import classify_geometry, tessellate_to_glb  # noqa: E402
+from nextis.assembly.models import AssemblyGraph  # noqa: E402
+from nextis.assembly.sequence_planner import SequencePlanner  # noqa: E402
+from nextis.errors import AssemblyError, CADParseError  # noqa: E402
+
+# All OCC tests share one xdist worker (``-n auto --dist loadgroup``) so the
+# session-scoped STEP files and parse result are built once, not once per worker.
+pytestmark = [
+    pytest.mark.skipif(not _occ_available, reason="OCP/pythonocc-core not installed"),
+    pytest.mark.xdist_group("occ"),
+]
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
-@pytest.fixture()
-def step_file_3parts(tmp_path: Path) -> Path:
-    """Create a STEP file with a box + two cylinders.
+@pytest.fixture(scope="session")
+def step_file_3parts(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a STEP file with a box + two cylinders (once per session).
 
     Layout (in metres):
     - Housing: 80x40x60mm box centred at origin
@@ -71,19 +83,46 @@ def step_file_3parts(tmp_path: Path) -> Path:
     pin = BRepPrimAPI_MakeCylinder(ax_pin, 0.003, 0.015).Shape()
     writer.Transfer(pin, STEPControl_AsIs)
 
-    step_path = tmp_path / "test_assembly.step"
+    step_path = tmp_path_factory.mktemp("step", numbered=False) / "test_assembly.step"
     status = writer.Write(str(step_path))
     assert status == IFSelect_RetDone, "Failed to write test STEP file"
     return step_path
 
 
-@pytest.fixture()
-def step_file_single_box(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def parsed_3parts(
+    step_file_3parts: Path, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[ParseResult, Path]:
+    """Parse the 3-part STEP file once per session.
+
+    Tests must treat the result as read-only; planning (which populates the
+    graph in place) goes through ``planned_3parts``.
+
+    Returns:
+        The parse result and the directory its GLB meshes were written to.
+    """
+    mesh_dir = tmp_path_factory.mktemp("meshes_3parts")
+    return CADParser().parse(step_file_3parts, mesh_dir), mesh_dir
+
+
+def _fresh(result: ParseResult) -> ParseResult:
+    """Copy a shared parse result so the planner can mutate its graph."""
+    return dataclasses.replace(result, graph=result.graph.model_copy(deep=True))
+
+
+@pytest.fixture(scope="session")
+def planned_3parts(parsed_3parts: tuple[ParseResult, Path]) -> AssemblyGraph:
+    """Plan the shared 3-part parse once per session (read-only for tests)."""
+    return SequencePlanner().plan(_fresh(parsed_3parts[0]))
+
+
+@pytest.fixture(scope="session")
+def step_file_single_box(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a STEP file with a single box (no assembly structure)."""
     writer = STEPControl_Writer()
     box = BRepPrimAPI_MakeBox(0.1, 0.05, 0.03).Shape()
     writer.Transfer(box, STEPControl_AsIs)
-    path = tmp_path / "single_box.step"
+    path = tmp_path_factory.mktemp("step_single", numbered=False) / "single_box.step"
     status = writer.Write(str(path))
     assert status == IFSelect_RetDone
     return path
@@ -162,28 +201,18 @@ def step_file_nested_hierarchy(tmp_path: Path) -> Path:
 class TestCADParser:
     """Tests for CADParser.parse()."""
 
-    def test_parse_extracts_correct_part_count(self, step_file_3parts: Path, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
+    def test_parse_extracts_correct_part_count(self, parsed_3parts: tuple[ParseResult, Path]):
+        result, _mesh_dir = parsed_3parts
         assert len(result.graph.parts) == 3
 
-    def test_parse_generates_glb_files(self, step_file_3parts: Path, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-
-        mesh_dir = tmp_path / "meshes"
-        parser = CADParser()
-        parser.parse(step_file_3parts, mesh_dir)
+    def test_parse_generates_glb_files(self, parsed_3parts: tuple[ParseResult, Path]):
+        _result, mesh_dir = parsed_3parts
 
         glb_files = list(mesh_dir.glob("*.glb"))
         assert len(glb_files) >= 1, f"Expected GLB files, found: {glb_files}"
 
-    def test_parse_assigns_position_and_geometry(self, step_file_3parts: Path, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
+    def test_parse_assigns_position_and_geometry(self, parsed_3parts: tuple[ParseResult, Path]):
+        result, _mesh_dir = parsed_3parts
 
         for part in result.graph.parts.values():
             assert part.position is not None, f"{part.id} missing position"
@@ -192,11 +221,8 @@ class TestCADParser:
             assert part.dimensions is not None and len(part.dimensions) >= 1
             assert part.color is not None and part.color.startswith("#")
 
-    def test_parse_assigns_mesh_file_paths(self, step_file_3parts: Path, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
+    def test_parse_assigns_mesh_file_paths(self, parsed_3parts: tuple[ParseResult, Path]):
+        result, _mesh_dir = parsed_3parts
 
         parts_with_mesh = [p for p in result.graph.parts.values() if p.mesh_file]
         assert len(parts_with_mesh) >= 1, "Expected at least one part with mesh_file"
@@ -204,24 +230,17 @@ class TestCADParser:
             assert ".glb" in part.mesh_file
 
     def test_parse_single_part(self, step_file_single_box: Path, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-
         parser = CADParser()
         result = parser.parse(step_file_single_box, tmp_path / "meshes")
         assert len(result.graph.parts) == 1
         assert result.contacts == []
 
     def test_parse_nonexistent_file_raises(self, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-
         parser = CADParser()
         with pytest.raises(FileNotFoundError):
             parser.parse(tmp_path / "no_such_file.step", tmp_path / "meshes")
 
     def test_parse_invalid_suffix_raises(self, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-        from nextis.errors import CADParseError
-
         bad_file = tmp_path / "readme.txt"
         bad_file.write_text("not a step file")
         parser = CADParser()
@@ -230,8 +249,6 @@ class TestCADParser:
 
     def test_tessellate_returns_bbox_center(self, tmp_path: Path):
         """tessellate_to_glb returns (True, bbox_center) with correct center."""
-        from nextis.assembly.mesh_utils import tessellate_to_glb
-
         # Box at offset position — bbox center should be near (12.5, 22.5, 32.5)
         box = BRepPrimAPI_MakeBox(gp_Pnt(10.0, 20.0, 30.0), 5.0, 5.0, 5.0).Shape()
         output = tmp_path / "test_bbox_center.glb"
@@ -265,8 +282,6 @@ class TestCADParser:
 
     def test_tessellate_failure_returns_zero_centroid(self, tmp_path: Path):
         """Failed tessellation returns (False, [0, 0, 0])."""
-        from nextis.assembly.mesh_utils import tessellate_to_glb
-
         try:
             from OCP.TopoDS import TopoDS_Shape
         except ImportError:
@@ -279,24 +294,18 @@ class TestCADParser:
         assert success is False
         assert centroid == [0.0, 0.0, 0.0]
 
-    def test_parse_positions_are_distinct(self, step_file_3parts: Path, tmp_path: Path):
+    def test_parse_positions_are_distinct(self, parsed_3parts: tuple[ParseResult, Path]):
         """All parts in a multi-part assembly must have distinct positions."""
-        from nextis.assembly.cad_parser import CADParser
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
+        result, _mesh_dir = parsed_3parts
 
         positions = [tuple(p.position) for p in result.graph.parts.values()]
         assert len(set(positions)) == len(positions), f"Parts have duplicate positions: {positions}"
 
-    def test_assembly_graph_round_trip(self, step_file_3parts: Path, tmp_path: Path):
+    def test_assembly_graph_round_trip(
+        self, parsed_3parts: tuple[ParseResult, Path], tmp_path: Path
+    ):
         """Graph from parser survives JSON serialize/deserialize."""
-        from nextis.assembly.cad_parser import CADParser
-        from nextis.assembly.models import AssemblyGraph
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
-        graph = result.graph
+        graph = parsed_3parts[0].graph
 
         json_path = tmp_path / "test_graph.json"
         graph.to_json_file(json_path)
@@ -312,8 +321,6 @@ class TestCADParser:
     # ------------------------------------------------------------------
     def test_mm_input_produces_metre_positions(self, tmp_path: Path):
         """STEP file in mm (coords > 1.0) produces metre-scale Part positions."""
-        from nextis.assembly.cad_parser import CADParser
-
         writer = STEPControl_Writer()
         # Box at (10, 20, 30) with size 50x50x50 — clearly in mm
         box = BRepPrimAPI_MakeBox(gp_Pnt(10.0, 20.0, 30.0), 50.0, 50.0, 50.0).Shape()
@@ -337,12 +344,9 @@ class TestCADParser:
             f"Expected metre-scale dimensions, got {part.dimensions}"
         )
 
-    def test_metre_input_no_double_scaling(self, step_file_3parts: Path, tmp_path: Path):
+    def test_metre_input_no_double_scaling(self, parsed_3parts: tuple[ParseResult, Path]):
         """STEP file already in metres (coords < 1.0) must not be scaled again."""
-        from nextis.assembly.cad_parser import CADParser
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
+        result, _mesh_dir = parsed_3parts
 
         assert result.units == "m"
         assert result.unit_scale == pytest.approx(1.0)
@@ -356,8 +360,6 @@ class TestCADParser:
         """tessellate_to_glb with unit_scale=0.001 produces metre-scale GLB."""
         import trimesh
 
-        from nextis.assembly.mesh_utils import tessellate_to_glb
-
         # Box 50x50x50 at origin — in mm
         box = BRepPrimAPI_MakeBox(50.0, 50.0, 50.0).Shape()
         output = tmp_path / "scaled.glb"
@@ -376,14 +378,11 @@ class TestCADParser:
             f"Expected metre-scale GLB extents, got {extents}"
         )
 
-    def test_unit_scale_json_round_trip(self, step_file_3parts: Path, tmp_path: Path):
+    def test_unit_scale_json_round_trip(
+        self, parsed_3parts: tuple[ParseResult, Path], tmp_path: Path
+    ):
         """unitScale field round-trips through JSON serialization."""
-        from nextis.assembly.cad_parser import CADParser
-        from nextis.assembly.models import AssemblyGraph
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
-        graph = result.graph
+        graph = parsed_3parts[0].graph
 
         json_path = tmp_path / "unit_scale_rt.json"
         graph.to_json_file(json_path)
@@ -404,8 +403,6 @@ class TestCADParser:
             BoxA: (0.0105, 0.0005, -0.0055)
             BoxB: (0.011, 0.004, -0.001)
         """
-        from nextis.assembly.cad_parser import CADParser
-
         parser = CADParser()
         result = parser.parse(step_file_nested_hierarchy, tmp_path / "meshes")
 
@@ -432,8 +429,6 @@ class TestCADParser:
         self, step_file_nested_hierarchy: Path, tmp_path: Path
     ):
         """Parts from nested hierarchy must not share positions."""
-        from nextis.assembly.cad_parser import CADParser
-
         parser = CADParser()
         result = parser.parse(step_file_nested_hierarchy, tmp_path / "meshes")
 
@@ -449,31 +444,28 @@ class TestCADParser:
 class TestClassifyGeometry:
     """Tests for the classify_geometry helper."""
 
-    def test_box(self):
-        from nextis.assembly.mesh_utils import classify_geometry
-
-        geo, dims = classify_geometry(0.08, 0.04, 0.06)
-        assert geo == "box"
-        assert dims == [0.08, 0.04, 0.06]
-
-    def test_cylinder(self):
-        from nextis.assembly.mesh_utils import classify_geometry
-
-        geo, _dims = classify_geometry(0.03, 0.1, 0.03)
-        assert geo == "cylinder"
-
-    def test_sphere(self):
-        from nextis.assembly.mesh_utils import classify_geometry
-
-        geo, _dims = classify_geometry(0.05, 0.05, 0.048)
-        assert geo == "sphere"
-
-    def test_flat_box(self):
-        from nextis.assembly.mesh_utils import classify_geometry
-
-        geo, dims = classify_geometry(0.1, 0.01, 0.1)
-        assert geo == "box"
-        assert len(dims) == 3
+    @pytest.mark.parametrize(
+        "extents,expected_geo,expected_dims",
+        [
+            ((0.08, 0.04, 0.06), "box", [0.08, 0.04, 0.06]),
+            ((0.03, 0.1, 0.03), "cylinder", None),
+            ((0.05, 0.05, 0.048), "sphere", None),
+            ((0.1, 0.01, 0.1), "box", None),
+        ],
+        ids=["box", "cylinder", "sphere", "flat_box"],
+    )
+    def test_classify_geometry(
+        self,
+        extents: tuple[float, float, float],
+        expected_geo: str,
+        expected_dims: list[float] | None,
+    ):
+        geo, dims = classify_geometry(*extents)
+        assert geo == expected_geo
+        if expected_dims is not None:
+            assert dims == expected_dims
+        if geo == "box":
+            assert len(dims) == 3
 
 
 # ---------------------------------------------------------------------------
@@ -482,38 +474,21 @@ class TestClassifyGeometry:
 class TestSequencePlanner:
     """Tests for SequencePlanner.plan()."""
 
-    def test_generates_steps(self, step_file_3parts: Path, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-        from nextis.assembly.sequence_planner import SequencePlanner
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
-
-        planner = SequencePlanner()
-        graph = planner.plan(result)
+    def test_generates_steps(self, planned_3parts: AssemblyGraph):
+        graph = planned_3parts
 
         assert len(graph.steps) > 0
         assert len(graph.step_order) == len(graph.steps)
 
-    def test_step_order_ids_exist_in_steps(self, step_file_3parts: Path, tmp_path: Path):
-        from nextis.assembly.cad_parser import CADParser
-        from nextis.assembly.sequence_planner import SequencePlanner
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
-        graph = SequencePlanner().plan(result)
+    def test_step_order_ids_exist_in_steps(self, planned_3parts: AssemblyGraph):
+        graph = planned_3parts
 
         for step_id in graph.step_order:
             assert step_id in graph.steps, f"{step_id} not in steps dict"
 
-    def test_dependencies_respected(self, step_file_3parts: Path, tmp_path: Path):
+    def test_dependencies_respected(self, planned_3parts: AssemblyGraph):
         """All dependencies appear before their dependent step in step_order."""
-        from nextis.assembly.cad_parser import CADParser
-        from nextis.assembly.sequence_planner import SequencePlanner
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
-        graph = SequencePlanner().plan(result)
+        graph = planned_3parts
 
         order_index = {sid: i for i, sid in enumerate(graph.step_order)}
         for step_id, step in graph.steps.items():
@@ -523,11 +498,6 @@ class TestSequencePlanner:
                 )
 
     def test_empty_parts_raises(self):
-        from nextis.assembly.cad_parser import ParseResult
-        from nextis.assembly.models import AssemblyGraph
-        from nextis.assembly.sequence_planner import SequencePlanner
-        from nextis.errors import AssemblyError
-
         empty = ParseResult(
             graph=AssemblyGraph(id="empty", name="Empty"),
             contacts=[],
@@ -535,15 +505,9 @@ class TestSequencePlanner:
         with pytest.raises(AssemblyError, match="no parts"):
             SequencePlanner().plan(empty)
 
-    def test_full_pipeline_round_trip(self, step_file_3parts: Path, tmp_path: Path):
+    def test_full_pipeline_round_trip(self, planned_3parts: AssemblyGraph, tmp_path: Path):
         """Full pipeline: parse → plan → serialize → deserialize."""
-        from nextis.assembly.cad_parser import CADParser
-        from nextis.assembly.models import AssemblyGraph
-        from nextis.assembly.sequence_planner import SequencePlanner
-
-        parser = CADParser()
-        result = parser.parse(step_file_3parts, tmp_path / "meshes")
-        graph = SequencePlanner().plan(result)
+        graph = planned_3parts
 
         json_path = tmp_path / "full_pipeline.json"
         graph.to_json_file(json_path)
@@ -1,19 +1,24 @@
 """Perception verification tests — checkers, verifier dispatch, and mock data.
 
-17 tests covering all four checker types with pass/fail scenarios, the
+Tests covering all four checker types with pass/fail scenarios, the
 StepVerifier dispatcher, and MockRobot.generate_execution_data for each
 criteria type.
 """
 
 from __future__ import annotations
 
+import importlib
 import math
+import os
+from pathlib import Path
 
 import numpy as np
 import pytest
+import torch
 
 from nextis.assembly.models import AssemblyStep, SuccessCriteria
 from nextis.hardware.mock import MockRobot
+from nextis.perception import checks
 from nextis.perception.checks import (
     check_classifier,
     check_force_signature,
@@ -28,6 +33,28 @@ from nextis.perception.verifier import StepVerifier
 # ---------------------------------------------------------------------------
 
 
+class _ConstLogits(torch.nn.Module):
+    """Classifier stub that returns fixed logits for every frame."""
+
+    def __init__(self, logits: list[float]) -> None:
+        super().__init__()
+        self.register_buffer("logits", torch.tensor([logits]))
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.logits.expand(x.shape[0], -1)
+
+
+def _save_classifier(path: Path, logits: list[float]) -> str:
+    """Pickle a constant-logit classifier to ``path`` and return it as a str."""
+    torch.save(_ConstLogits(logits), str(path))
+    return str(path)
+
+
+def _camera_data() -> ExecutionData:
+    """ExecutionData carrying a black 224x224 RGB frame."""
+    return ExecutionData(camera_frame=np.zeros((224, 224, 3), dtype=np.uint8))
+
+
 def _make_step(
     criteria_type: str = "position",
     threshold: float | None = None,
@@ -95,6 +122,45 @@ def test_check_position_no_target() -> None:
     assert result.confidence == pytest.approx(0.3)
 
 
+def test_check_position_repeat_hits_cache() -> None:
+    """Re-verifying identical inputs is served from the cache as a fresh copy."""
+    step = _make_step(
+        criteria_type="position",
+        primitive_params={"target_pose": [10.0, 20.0, 30.0]},
+    )
+    checks._check_position_cached.cache_clear()
+    first = check_position(step, ExecutionData(final_position=[10.0, 20.0, 33.0]))
+    second = check_position(step, ExecutionData(final_position=[10.0, 20.0, 33.0]))
+
+    assert checks._check_position_cached.cache_info().hits == 1
+    assert first == second
+    assert first is not second
+    assert first.passed is False
+    assert first.measured_value == pytest.approx(3.0)
+
+    # Mutating a returned result must not corrupt later verifications
+    first.confidence = 0.0
+    third = check_position(step, ExecutionData(final_position=[10.0, 20.0, 33.0]))
+    assert third.confidence == pytest.approx(0.85)
+
+
+def test_check_cache_disabled_by_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """NEXTIS_CHECK_CACHE=0 turns the checker caches off."""
+    monkeypatch.setenv("NEXTIS_CHECK_CACHE", "0")
+    try:
+        reloaded = importlib.reload(checks)
+        step = _make_step(criteria_type="force_threshold", threshold=10.0)
+        reloaded.check_force_threshold(step, ExecutionData(peak_force=12.0))
+        reloaded.check_force_threshold(step, ExecutionData(peak_force=12.0))
+
+        info = reloaded._check_force_threshold_cached.cache_info()
+        assert info.maxsize == 0
+        assert info.hits == 0
+    finally:
+        monkeypatch.delenv("NEXTIS_CHECK_CACHE")
+        importlib.reload(checks)
+
+
 # ---------------------------------------------------------------------------
 # 2. Force threshold checker
 # ---------------------------------------------------------------------------
@@ -247,6 +313,52 @@ def test_check_classifier_no_camera(tmp_path: object) -> None:
     assert result.confidence == pytest.approx(0.4)
 
 
+def test_check_classifier_caches_until_checkpoint_changes(tmp_path: Path) -> None:
+    """The loaded model is cached per (path, mtime) and reloaded when rewritten."""
+    model = _save_classifier(tmp_path / "model.pt", [2.0])
+    step = _make_step(criteria_type="classifier", model=model)
+    checks._load_classifier.cache_clear()
+
+    assert check_classifier(step, _camera_data()).passed is True
+    assert check_classifier(step, _camera_data()).passed is True
+    info = checks._load_classifier.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    # Retrained checkpoint: new contents and a strictly newer mtime
+    mtime_ns = os.stat(model).st_mtime_ns
+    _save_classifier(tmp_path / "model.pt", [-2.0])
+    os.utime(model, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+    assert check_classifier(step, _camera_data()).passed is False
+    assert checks._load_classifier.cache_info().misses == 2
+
+
+def _sigmoid(x: float) -> float:
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+@pytest.mark.parametrize(
+    "logits,passed,confidence",
+    [
+        ([2.0], True, _sigmoid(2.0)),
+        ([-2.0], False, _sigmoid(2.0)),
+        ([0.0, 1.0], True, _sigmoid(1.0)),
+        ([1.0, 0.0], False, _sigmoid(1.0)),
+    ],
+    ids=["logit_pos", "logit_neg", "softmax_pass", "softmax_fail"],
+)
+def test_check_classifier_verdict(
+    tmp_path: Path, logits: list[float], passed: bool, confidence: float
+) -> None:
+    """Single-logit models decide by sign; two-class models by softmax >= 0.5."""
+    model = _save_classifier(tmp_path / "model.pt", logits)
+    step = _make_step(criteria_type="classifier", model=model)
+    result = check_classifier(step, _camera_data())
+
+    assert result.passed is passed
+    assert result.confidence == pytest.approx(confidence)
+
+
 # ---------------------------------------------------------------------------
 # 5. StepVerifier dispatch
 # ---------------------------------------------------------------------------
@@ -309,7 +421,8 @@ def test_mock_execution_data(
     exec_data = mock.generate_execution_data(step, force_success=True)
 
     assert exec_data.duration_ms > 0
-    assert isinstance(exec_data.force_history, list)
+    assert isinstance(exec_data.force_history, np.ndarray)
+    assert exec_data.force_count == len(exec_data.force_history)
 
     # Feed through the checker — must pass
     result = checker(step, exec_data)  # type: ignore[operator]
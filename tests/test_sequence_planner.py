@@ -2,49 +2,40 @@
 
 from __future__ import annotations
 
-from nextis.assembly.models import AssemblyGraph
+from nextis.assembly.models import AssemblyGraph, AssemblyStep, Part, SuccessCriteria
 from nextis.assembly.sequence_planner import assign_handlers
 
+# Shared read-only part: assign_handlers only touches steps.
+_PART_A = Part(
+    id="part_a",
+    position=[0, 0, 0],
+    geometry="box",
+    dimensions=[0.05, 0.05, 0.05],
+    color="#AAA",
+)
+
 
 def _make_graph(steps_data: list[dict]) -> AssemblyGraph:
     """Build a minimal AssemblyGraph from a list of step dicts."""
-    steps = {}
-    order = []
-    for s in steps_data:
-        sid = s["id"]
-        steps[sid] = {
-            "id": sid,
-            "name": s.get("name", sid),
-            "partIds": ["part_a"],
-            "dependencies": [],
-            "handler": s.get("handler", ""),
-            "primitiveType": s.get("primitiveType"),
-            "primitiveParams": None,
-            "policyId": None,
-            "successCriteria": {"type": "position"},
-            "maxRetries": 1,
-        }
-        order.append(sid)
-
-    data = {
-        "id": "test",
-        "name": "Test",
-        "parts": {
-            "part_a": {
-                "id": "part_a",
-                "cadFile": None,
-                "meshFile": None,
-                "graspPoints": [],
-                "position": [0, 0, 0],
-                "geometry": "box",
-                "dimensions": [0.05, 0.05, 0.05],
-                "color": "#AAA",
-            },
-        },
-        "steps": steps,
-        "stepOrder": order,
+    steps = {
+        s["id"]: AssemblyStep(
+            id=s["id"],
+            name=s.get("name", s["id"]),
+            part_ids=["part_a"],
+            handler=s.get("handler", ""),
+            primitive_type=s.get("primitiveType"),
+            success_criteria=SuccessCriteria(type="position"),
+            max_retries=1,
+        )
+        for s in steps_data
     }
-    return AssemblyGraph.model_validate(data)
+    return AssemblyGraph(
+        id="test",
+        name="Test",
+        parts={"part_a": _PART_A},
+        steps=steps,
+        step_order=list(steps),
+    )
 
 
 def test_assign_handlers_geometric_primitives() -> None:
@@ -8,11 +8,13 @@ dispatch.  All without GPU or real hardware.
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 
 import h5py
 import numpy as np
 import pytest
+import pytest_asyncio
 import torch
 
 from nextis.assembly.models import AssemblyStep
@@ -23,11 +25,36 @@ from nextis.learning.trainer import MinimalACT, PolicyTrainer, TrainingConfig, T
 
 logger = logging.getLogger(__name__)
 
+# Under pytest-xdist (``-n auto --dist loadgroup``) every worker would otherwise
+# start a full intra-op thread pool and oversubscribe the cores. The module runs
+# on a single worker so the session-scoped demos and trained policy are built
+# once, not once per worker.
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    torch.set_num_threads(1)
+
+pytestmark = pytest.mark.xdist_group("training")
+
 ASSEMBLY_ID = "test_pipe"
 STEP_ID = "step_001"
 NUM_FRAMES = 100
-JOINT_KEYS = sorted(["base", "gripper", "link1", "link2", "link3", "link4", "link5"])
+JOINT_KEYS = ("base", "gripper", "link1", "link2", "link3", "link4", "link5")  # sorted
 NUM_JOINTS = len(JOINT_KEYS)
+# Fewest full-batch epochs that reliably show the loss dropping
+LOSS_TEST_EPOCHS = 3
+
+# Joint trajectories shared by every synthetic demo: one phase-shifted sine
+# per joint, with the action leading the observation by 0.1 rad.
+_T = np.linspace(0, 2 * np.pi, NUM_FRAMES)
+_PHASE = _T[:, None] + np.arange(NUM_JOINTS) * 0.5
+_JP = (np.sin(_PHASE) * 0.3).astype(np.float32)
+_AP = (np.sin(_PHASE + 0.1) * 0.3).astype(np.float32)
+_TIMESTAMPS = np.linspace(0, 2.0, NUM_FRAMES)
+# Idle gripper and force channels; h5py copies these on write, so sharing is safe.
+_ZERO_1D = np.zeros(NUM_FRAMES, dtype=np.float32)
+_ZERO_2D = np.zeros((NUM_FRAMES, NUM_JOINTS), dtype=np.float32)
+
+# Observation used for inference checks, ordered like JOINT_KEYS.
+_OBS_VEC = np.array([0.1, 0.0, 0.2, 0.3, 0.4, 0.5, 0.6], dtype=np.float32)
 
 
 # ---------------------------------------------------------------------------
@@ -35,52 +62,53 @@ NUM_JOINTS = len(JOINT_KEYS)
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def demo_dir(tmp_path: Path) -> Path:
-    """Create 2 synthetic HDF5 demos matching DemoRecorder output schema."""
-    demo_path = tmp_path / "demos" / ASSEMBLY_ID / STEP_ID
+def _write_demo(fname: Path, demo_idx: int) -> None:
+    """Write one synthetic demo in the DemoRecorder HDF5 layout."""
+    with h5py.File(str(fname), "w", libver="latest") as f:
+        # File-level attributes
+        f.attrs.update(
+            {
+                "assembly_id": ASSEMBLY_ID,
+                "step_id": STEP_ID,
+                "demo_id": f"demo_{demo_idx:03d}",
+                "num_frames": NUM_FRAMES,
+                "recording_hz": 50,
+                "timestamp": 1700000000.0 + demo_idx,
+            }
+        )
+
+        f.create_dataset("timestamps", data=_TIMESTAMPS)
+
+        # Observation group
+        obs_grp = f.create_group("observation")
+        obs_grp.create_dataset("joint_positions", data=_JP)
+        obs_grp.attrs["joint_keys"] = JOINT_KEYS
+
+        obs_grp.create_dataset("gripper_state", data=_ZERO_1D)
+        obs_grp.create_dataset("force_torque", data=_ZERO_2D)
+
+        # Action group
+        act_grp = f.create_group("action")
+        act_grp.create_dataset("joint_positions", data=_AP)
+        act_grp.attrs["joint_keys"] = JOINT_KEYS
+
+
+@pytest.fixture(scope="session")
+def demo_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create 2 synthetic HDF5 demos matching DemoRecorder output schema.
+
+    Session-scoped: the demos are read-only inputs, so they are written once.
+    Tests that produce artifacts (policies, checkpoints) use their own
+    ``tmp_path`` instead of writing next to the shared demos.
+    """
+    demo_root = tmp_path_factory.mktemp("demos_root")
+    demo_path = demo_root / "demos" / ASSEMBLY_ID / STEP_ID
     demo_path.mkdir(parents=True)
 
     for demo_idx in range(2):
-        fname = demo_path / f"demo_{demo_idx:03d}.hdf5"
-        with h5py.File(str(fname), "w") as f:
-            # File-level attributes
-            f.attrs["assembly_id"] = ASSEMBLY_ID
-            f.attrs["step_id"] = STEP_ID
-            f.attrs["demo_id"] = f"demo_{demo_idx:03d}"
-            f.attrs["num_frames"] = NUM_FRAMES
-            f.attrs["recording_hz"] = 50
-            f.attrs["timestamp"] = 1700000000.0 + demo_idx
-
-            f.create_dataset("timestamps", data=np.linspace(0, 2.0, NUM_FRAMES))
-
-            # Observation group
-            obs_grp = f.create_group("observation")
-            t = np.linspace(0, 2 * np.pi, NUM_FRAMES)
-            jp = np.column_stack([np.sin(t + i * 0.5) * 0.3 for i in range(NUM_JOINTS)]).astype(
-                np.float32
-            )
-            obs_grp.create_dataset("joint_positions", data=jp)
-            obs_grp.attrs["joint_keys"] = JOINT_KEYS
-
-            obs_grp.create_dataset(
-                "gripper_state",
-                data=np.zeros(NUM_FRAMES, dtype=np.float32),
-            )
-            obs_grp.create_dataset(
-                "force_torque",
-                data=np.zeros((NUM_FRAMES, NUM_JOINTS), dtype=np.float32),
-            )
-
-            # Action group
-            act_grp = f.create_group("action")
-            ap = np.column_stack(
-                [np.sin(t + i * 0.5 + 0.1) * 0.3 for i in range(NUM_JOINTS)]
-            ).astype(np.float32)
-            act_grp.create_dataset("joint_positions", data=ap)
-            act_grp.attrs["joint_keys"] = JOINT_KEYS
-
-    return tmp_path
+        _write_demo(demo_path / f"demo_{demo_idx:03d}.hdf5", demo_idx)
+
+    return demo_root
 
 
 # ---------------------------------------------------------------------------
@@ -93,10 +121,19 @@ def _build_dataset(demo_dir: Path) -> DatasetInfo:
     return StepDataset(ASSEMBLY_ID, STEP_ID, data_dir=str(demo_dir)).build()
 
 
-async def _train_policy(demo_dir: Path, chunk_size: int = 4, num_epochs: int = 5) -> tuple:
-    """Build dataset + train, returning (dataset_info, training_result, policies_dir)."""
-    info = _build_dataset(demo_dir)
-    policies_dir = demo_dir / "policies"
+async def _train_policy(
+    demo_dir: Path,
+    policies_dir: Path,
+    chunk_size: int = 4,
+    num_epochs: int = 5,
+    info: DatasetInfo | None = None,
+) -> tuple:
+    """Build dataset + train, returning (dataset_info, training_result, policies_dir).
+
+    Pass ``info`` to reuse an already-built dataset instead of rebuilding it.
+    """
+    if info is None:
+        info = _build_dataset(demo_dir)
     trainer = PolicyTrainer(policies_dir=str(policies_dir))
     config = TrainingConfig(
         num_epochs=num_epochs, batch_size=16, chunk_size=chunk_size, hidden_dim=32
@@ -105,6 +142,32 @@ async def _train_policy(demo_dir: Path, chunk_size: int = 4, num_epochs: int = 5
     return info, result, policies_dir
 
 
+@pytest.fixture(scope="session")
+def dataset_info(demo_dir: Path) -> DatasetInfo:
+    """Dataset built once from the shared demos; consumers only read it."""
+    return _build_dataset(demo_dir)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def trained_policy(
+    demo_dir: Path, dataset_info: DatasetInfo, tmp_path_factory: pytest.TempPathFactory
+) -> tuple:
+    """Train one small policy shared by the load, predict and router tests.
+
+    The checkpoint is only read by its consumers, so a single seeded
+    training run stands in for one per test.
+    """
+    torch.manual_seed(0)
+    np.random.seed(0)
+    return await _train_policy(
+        demo_dir,
+        tmp_path_factory.mktemp("policies"),
+        chunk_size=4,
+        num_epochs=3,
+        info=dataset_info,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Test 1: Synthetic HDF5 schema validation
 # ---------------------------------------------------------------------------
@@ -128,10 +191,10 @@ def test_demo_hdf5_schema(demo_dir: Path) -> None:
 
         obs_keys = list(f["observation"].attrs["joint_keys"])
         assert len(obs_keys) == NUM_JOINTS
-        assert obs_keys == JOINT_KEYS
+        assert obs_keys == list(JOINT_KEYS)
 
         act_keys = list(f["action"].attrs["joint_keys"])
-        assert act_keys == JOINT_KEYS
+        assert act_keys == list(JOINT_KEYS)
 
 
 # ---------------------------------------------------------------------------
@@ -139,9 +202,9 @@ def test_demo_hdf5_schema(demo_dir: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_dataset_build(demo_dir: Path) -> None:
+def test_dataset_build(dataset_info: DatasetInfo) -> None:
     """StepDataset.build() merges HDF5 demos and reads joint_keys."""
-    info = _build_dataset(demo_dir)
+    info = dataset_info
 
     assert info.assembly_id == ASSEMBLY_ID
     assert info.step_id == STEP_ID
@@ -153,7 +216,7 @@ def test_dataset_build(demo_dir: Path) -> None:
     assert info.val_frames == total_frames - info.train_frames
 
     assert len(info.joint_keys) == NUM_JOINTS
-    assert info.joint_keys == JOINT_KEYS
+    assert info.joint_keys == list(JOINT_KEYS)
 
     # Verify numpy files exist and have correct shapes
     assert (info.output_dir / "train_obs.npy").exists()
@@ -172,25 +235,30 @@ def test_dataset_build(demo_dir: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_training_loss_decreases(demo_dir: Path) -> None:
-    """Training for 5 epochs produces a checkpoint with decreasing loss."""
-    info = _build_dataset(demo_dir)
-    policies_dir = demo_dir / "policies"
+async def test_training_loss_decreases(dataset_info: DatasetInfo, tmp_path: Path) -> None:
+    """A few seeded full-batch epochs produce a checkpoint with decreasing loss."""
+    info = dataset_info
+    policies_dir = tmp_path / "policies"
     trainer = PolicyTrainer(policies_dir=str(policies_dir))
-    config = TrainingConfig(num_epochs=5, batch_size=16, chunk_size=4, hidden_dim=32)
+    # One optimizer step per epoch; seeded so the descent is reproducible
+    torch.manual_seed(0)
+    config = TrainingConfig(
+        num_epochs=LOSS_TEST_EPOCHS, batch_size=info.train_frames, chunk_size=4, hidden_dim=32
+    )
 
-    losses: list[float] = []
+    # One slot per epoch; NaN marks an epoch that never reported progress
+    losses = np.full(config.num_epochs, np.nan)
 
     def on_progress(p: TrainingProgress) -> None:
-        losses.append(p.loss)
+        losses[p.epoch] = p.loss
 
     result = await trainer.train(info, config=config, on_progress=on_progress)
 
     assert result.checkpoint_path.exists()
-    assert result.epochs_trained == 5
+    assert result.epochs_trained == LOSS_TEST_EPOCHS
     assert result.final_loss > 0
-    assert len(losses) == 5
-    # Loss should decrease over 5 epochs (at least last < first)
+    assert np.isfinite(losses).all(), f"Missing progress callbacks: {losses}"
+    # Loss should decrease over training (at least last < first)
     assert losses[-1] < losses[0], f"Loss did not decrease: {losses}"
 
 
@@ -199,9 +267,9 @@ async def test_training_loss_decreases(demo_dir: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_policy_load_and_exists(demo_dir: Path) -> None:
+def test_policy_load_and_exists(trained_policy: tuple) -> None:
     """PolicyLoader loads a trained checkpoint and exists() works."""
-    _, _, policies_dir = await _train_policy(demo_dir, chunk_size=4, num_epochs=3)
+    _, _, policies_dir = trained_policy
     loader = PolicyLoader(policies_dir=policies_dir)
 
     # exists() should return True for trained step, False for non-existent
@@ -214,33 +282,28 @@ async def test_policy_load_and_exists(demo_dir: Path) -> None:
     assert policy.action_dim == NUM_JOINTS
     assert policy.chunk_size == 4
     assert len(policy.joint_keys) == NUM_JOINTS
-    assert policy.joint_keys == JOINT_KEYS
+    assert policy.joint_keys == list(JOINT_KEYS)
 
 
 # ---------------------------------------------------------------------------
-# Test 5: Policy.predict() returns correct shape with finite values
+# Test 5: Policy.predict_vec() returns correct shape with finite values
 # ---------------------------------------------------------------------------
 
 
-async def test_policy_predict_shape(demo_dir: Path) -> None:
-    """Policy.predict() returns (chunk_size, action_dim) finite array."""
-    _, _, policies_dir = await _train_policy(demo_dir, chunk_size=4, num_epochs=3)
+def test_policy_predict_shape(trained_policy: tuple) -> None:
+    """Policy.predict_vec() returns (chunk_size, action_dim) finite array."""
+    _, _, policies_dir = trained_policy
     loader = PolicyLoader(policies_dir=policies_dir)
     policy = loader.load(ASSEMBLY_ID, STEP_ID)
     assert policy is not None
 
-    obs = {
-        "base": 0.1,
-        "gripper": 0.0,
-        "link1": 0.2,
-        "link2": 0.3,
-        "link3": 0.4,
-        "link4": 0.5,
-        "link5": 0.6,
-    }
-    actions = policy.predict(obs)
+    actions = policy.predict_vec(_OBS_VEC)
     assert actions.shape == (4, NUM_JOINTS)
-    assert np.all(np.isfinite(actions))
+    assert np.isfinite(actions).all()
+
+    # The dict path orders by joint_keys and must agree with the vector path
+    obs = dict(zip(JOINT_KEYS, _OBS_VEC.tolist(), strict=True))
+    np.testing.assert_array_equal(policy.predict(obs), actions)
 
 
 # ---------------------------------------------------------------------------
@@ -256,15 +319,18 @@ class _TrackingRobot:
         self.sent_actions: list[dict[str, float]] = []
 
     def get_observation(self) -> dict[str, float]:
-        return dict(self._obs)
+        return self._obs.copy()
 
     def send_action(self, action: dict[str, float]) -> None:
-        self.sent_actions.append(dict(action))
+        # The router builds a fresh dict per action, so keeping it is safe.
+        self.sent_actions.append(action)
 
 
-async def test_policy_router_dispatch(demo_dir: Path) -> None:
+async def test_policy_router_dispatch(
+    trained_policy: tuple, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """PolicyRouter dispatches a policy step end-to-end with a tracking mock."""
-    _, _, policies_dir = await _train_policy(demo_dir, chunk_size=4, num_epochs=3)
+    _, _, policies_dir = trained_policy
 
     obs = {
         "base": 0.1,
@@ -277,6 +343,19 @@ async def test_policy_router_dispatch(demo_dir: Path) -> None:
     }
     robot = _TrackingRobot(obs)
     loader = PolicyLoader(policies_dir=policies_dir)
+
+    # The loader caches the policy, so the router sees this spy
+    policy = loader.load(ASSEMBLY_ID, STEP_ID)
+    assert policy is not None
+    predict_calls: list[dict[str, float]] = []
+    real_predict = policy.predict
+
+    def spy_predict(observation: dict[str, float]) -> np.ndarray:
+        predict_calls.append(observation)
+        return real_predict(observation)
+
+    monkeypatch.setattr(policy, "predict", spy_predict)
+
     router = PolicyRouter(
         robot=robot,
         policy_loader=loader,
@@ -291,11 +370,12 @@ async def test_policy_router_dispatch(demo_dir: Path) -> None:
     assert result.duration_ms > 0
     assert result.error_message is None
 
-    # Robot should have received chunk_size action dicts
+    # One forward pass covers the whole chunk of chunk_size action dicts
+    assert len(predict_calls) == 1
     assert len(robot.sent_actions) == 4
     for action_dict in robot.sent_actions:
-        assert sorted(action_dict.keys()) == JOINT_KEYS
-        assert all(np.isfinite(v) for v in action_dict.values())
+        assert sorted(action_dict.keys()) == list(JOINT_KEYS)
+        assert np.isfinite(np.fromiter(action_dict.values(), dtype=float, count=NUM_JOINTS)).all()
 
 
 # ---------------------------------------------------------------------------
@@ -303,10 +383,10 @@ async def test_policy_router_dispatch(demo_dir: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_backward_compat_no_joint_keys(demo_dir: Path) -> None:
+async def test_backward_compat_no_joint_keys(tmp_path: Path) -> None:
     """Policy.predict() falls back to sorted(obs.keys()) for old checkpoints."""
     # Create a checkpoint WITHOUT joint_keys (simulating old format)
-    policies_dir = demo_dir / "policies"
+    policies_dir = tmp_path / "policies"
     ckpt_dir = policies_dir / ASSEMBLY_ID / "step_old"
     ckpt_dir.mkdir(parents=True)
 
@@ -343,4 +423,4 @@ async def test_backward_compat_no_joint_keys(demo_dir: Path) -> None:
     # Should still work via sorted(obs.keys()) fallback
     actions = policy.predict(obs)
     assert actions.shape == (4, NUM_JOINTS)
-    assert np.all(np.isfinite(actions))
+    assert np.isfinite(actions).all()